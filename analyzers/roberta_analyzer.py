@@ -1,8 +1,11 @@
+import hashlib
 import numpy as np
+import torch
 import logging
-from scipy.special import softmax
+import os
+from collections import OrderedDict
 
-from config.settings import ROBERTA_MODEL
+from config.settings import ROBERTA_MODEL, ROBERTA_USE_ONNX, MODEL_CACHE_DIR, TORCH_NUM_THREADS
 
 logger = logging.getLogger(__name__)
 
@@ -10,21 +13,129 @@ logger = logging.getLogger(__name__)
 class RobertaAnalyzer:
     """Deep sentiment analysis using a fine-tuned RoBERTa transformer model."""
 
-    def __init__(self, model_name: str = ROBERTA_MODEL):
-        from transformers import AutoModelForSequenceClassification, AutoTokenizer, AutoConfig
+    # Max cached results, keyed by text hash (LRU eviction)
+    CACHE_SIZE = 100_000
+
+    def __init__(self, model_name: str = ROBERTA_MODEL, onnx: bool = ROBERTA_USE_ONNX,
+                 quantize: bool = True):
+        from transformers import AutoTokenizer, AutoConfig
+
+        if not torch.cuda.is_available():
+            # PyTorch's default CPU threading oversubscribes shared hosts badly
+            torch.set_num_threads(TORCH_NUM_THREADS)
+            try:
+                torch.set_num_interop_threads(1)
+            except RuntimeError:
+                pass  # can only be set once per process, before any parallel work
 
         logger.info(f"Loading RoBERTa model: {model_name}")
-        self.tokenizer = AutoTokenizer.from_pretrained(model_name)
-        self.model = AutoModelForSequenceClassification.from_pretrained(model_name)
+        # Rust tokenizer, batch-encoding across threads
+        os.environ.setdefault("TOKENIZERS_PARALLELISM", "true")
+        self.tokenizer = AutoTokenizer.from_pretrained(model_name, use_fast=True)
+        if not self.tokenizer.is_fast:
+            logger.warning(f"No fast tokenizer for {model_name}; tokenization will be slow")
         self.config = AutoConfig.from_pretrained(model_name)
-        self.model.eval()
-        logger.info("RoBERTa model loaded successfully")
+        self._labels = tuple(self.config.id2label[i] for i in range(self.config.num_labels))
+        self.model = None
+        if onnx:
+            try:
+                self.model = self._load_onnx_model(model_name)
+                # ONNX Runtime takes CPU inputs and handles placement itself
+                self.device, self.dtype = "cpu", torch.float32
+            except ImportError as e:
+                logger.warning(f"ONNX backend unavailable ({e}), falling back to PyTorch")
+        if self.model is None:
+            self.model = self._load_torch_model(model_name)
+            self.model.eval()
+            self.model.requires_grad_(False)
+            self.device, self.dtype = self._select_device()
+            if self.device == "cpu" and quantize:
+                # int8 weights for the Linear layers; activations stay FP32
+                self.model = torch.ao.quantization.quantize_dynamic(
+                    self.model, {torch.nn.Linear}, dtype=torch.qint8
+                )
+                self.dtype = torch.float32
+            else:
+                self.model.to(self.device, dtype=self.dtype)
+        # Side stream for host-to-device copies so the next batch uploads
+        # while the current one is still running on the GPU.
+        self._copy_stream = torch.cuda.Stream() if self.device == "cuda" else None
+        self._cache = OrderedDict()
+        logger.info(f"RoBERTa model loaded successfully ({self.device}, {self.dtype})")
+
+    @staticmethod
+    def _load_torch_model(model_name: str):
+        """Load the PyTorch model with fused scaled-dot-product attention."""
+        from transformers import AutoModelForSequenceClassification
+
+        try:
+            return AutoModelForSequenceClassification.from_pretrained(
+                model_name, attn_implementation="sdpa"
+            )
+        except (TypeError, ValueError, ImportError) as e:
+            # Older transformers: no SDPA support for this architecture
+            logger.info(f"SDPA attention unavailable ({e}), trying BetterTransformer")
+
+        model = AutoModelForSequenceClassification.from_pretrained(model_name)
+        try:
+            return model.to_bettertransformer()
+        except Exception as e:
+            logger.info(f"BetterTransformer unavailable, using eager attention: {e}")
+            return model
+
+    @staticmethod
+    def _load_onnx_model(model_name: str):
+        """Load an ONNX Runtime export of the model, exporting it on first use."""
+        import onnxruntime as ort
+        from optimum.onnxruntime import ORTModelForSequenceClassification
+
+        sess_opts = ort.SessionOptions()
+        sess_opts.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        sess_opts.intra_op_num_threads = TORCH_NUM_THREADS
+        provider = "CUDAExecutionProvider" if torch.cuda.is_available() else "CPUExecutionProvider"
+
+        export_dir = MODEL_CACHE_DIR / "onnx" / model_name.replace("/", "--")
+        exported = (export_dir / "model.onnx").exists()
+        model = ORTModelForSequenceClassification.from_pretrained(
+            export_dir if exported else model_name,
+            export=not exported,
+            provider=provider,
+            session_options=sess_opts,
+        )
+        if not exported:
+            model.save_pretrained(export_dir)
+            logger.info(f"Exported ONNX model to {export_dir}")
+        return model
+
+    @staticmethod
+    def _select_device():
+        """Pick the inference device and the reduced precision it runs fastest in."""
+        if torch.cuda.is_available():
+            return "cuda", torch.float16
+        if getattr(torch.cpu, "_is_avx512_bf16_supported", lambda: False)():
+            return "cpu", torch.bfloat16
+        return "cpu", torch.float32
+
+    def _autocast(self):
+        return torch.autocast(
+            device_type=self.device, dtype=self.dtype,
+            enabled=self.dtype != torch.float32,
+        )
+
+    def _to_device(self, batch: dict) -> dict:
+        """Move a tokenized batch to the model device, asynchronously on CUDA."""
+        if self._copy_stream is None:
+            return {k: v.to(self.device) for k, v in batch.items()}
+        with torch.cuda.stream(self._copy_stream):
+            return {k: v.pin_memory().to(self.device, non_blocking=True) for k, v in batch.items()}
 
     def analyze(self, text: str) -> dict:
         encoded = self.tokenizer(text, return_tensors="pt", truncation=True, max_length=512)
-        with __import__("torch").no_grad():
+        encoded = {k: v.to(self.device) for k, v in encoded.items()}
+        with torch.inference_mode(), self._autocast():
             output = self.model(**encoded)
-        scores = softmax(output.logits[0].numpy())
+        # Softmax in FP32 for numerical stability, on the model device
+        scores = torch.softmax(output.logits[0].float(), dim=0).cpu().numpy()
         label_idx = int(np.argmax(scores))
         return {
             "roberta_label": self.config.id2label[label_idx],
@@ -35,25 +146,104 @@ class RobertaAnalyzer:
         }
 
     def analyze_batch(self, texts: list, batch_size: int = 32) -> list:
-        import torch
-
-        results = []
-        self.model.eval()
-        with torch.no_grad():
-            for i in range(0, len(texts), batch_size):
-                batch = texts[i : i + batch_size]
-                encoded = self.tokenizer(
-                    batch, return_tensors="pt", truncation=True, padding=True, max_length=512
+        """Analyze texts, only running the model on ones not seen before."""
+        keys = [hashlib.blake2b(t.encode(), digest_size=8).digest() for t in texts]
+
+        misses = {}
+        for key, text in zip(keys, texts):
+            if key in self._cache:
+                self._cache.move_to_end(key)
+            elif key not in misses:
+                misses[key] = text
+
+        fresh = dict(zip(misses, self._infer_batch(list(misses.values()), batch_size)))
+        results = [fresh[k] if k in fresh else self._cache[k] for k in keys]
+
+        self._cache.update(fresh)
+        while len(self._cache) > self.CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return results
+
+    def _infer_batch(self, texts: list, batch_size: int) -> list:
+        # Nothing to classify in empty texts; their NaN fields make the
+        # pipeline fall back to VADER for those rows
+        keep = [i for i, t in enumerate(texts) if t.strip()]
+        results = [self._skipped_result() for _ in texts]
+        for i, result in zip(keep, self._forward([texts[i] for i in keep], batch_size)):
+            results[i] = result
+        return results
+
+    @staticmethod
+    def _skipped_result() -> dict:
+        return {
+            "roberta_label": None,
+            "roberta_score": np.nan,
+            "roberta_positive": np.nan,
+            "roberta_negative": np.nan,
+            "roberta_neutral": np.nan,
+        }
+
+    def _forward(self, texts: list, batch_size: int) -> list:
+        if not texts:
+            return []
+
+        # Tokenize once without padding, then run batches in length order so each
+        # batch is padded only to its own longest member. Results are scattered
+        # back to input order.
+        encoded = self.tokenizer(texts, truncation=True, max_length=512)
+        input_ids = encoded["input_ids"]
+        attention_mask = encoded["attention_mask"]
+        order = np.argsort([len(ids) for ids in input_ids], kind="stable")
+
+        # Padding is cheap next to a forward pass, so each slab is padded
+        # in-process just before it's uploaded
+        slabs = [order[i : i + batch_size].tolist() for i in range(0, len(order), batch_size)]
+
+        def padded_batches():
+            for idx in slabs:
+                batch = self.tokenizer.pad(
+                    {
+                        "input_ids": [input_ids[j] for j in idx],
+                        "attention_mask": [attention_mask[j] for j in idx],
+                    },
+                    return_tensors="pt",
                 )
-                output = self.model(**encoded)
-                batch_scores = softmax(output.logits.numpy(), axis=1)
-                for scores in batch_scores:
-                    label_idx = int(np.argmax(scores))
-                    results.append({
-                        "roberta_label": self.config.id2label[label_idx],
-                        "roberta_score": float(scores[label_idx]),
-                        "roberta_positive": float(scores[2]),
-                        "roberta_negative": float(scores[0]),
-                        "roberta_neutral": float(scores[1]),
-                    })
+                yield idx, dict(batch)
+
+        results = [None] * len(texts)
+        with torch.inference_mode(), self._autocast():
+            batches = padded_batches()
+            idx, batch = next(batches)
+            pending = (idx, self._to_device(batch))
+            while pending is not None:
+                idx, batch = pending
+                if self._copy_stream is not None:
+                    compute_stream = torch.cuda.current_stream()
+                    compute_stream.wait_stream(self._copy_stream)
+                    for v in batch.values():
+                        v.record_stream(compute_stream)
+
+                output = self.model(**batch)
+                # Queue the next upload while the forward pass is in flight
+                upcoming = next(batches, None)
+                pending = None if upcoming is None else (upcoming[0], self._to_device(upcoming[1]))
+
+                batch_scores = torch.softmax(output.logits.float(), dim=1).cpu().numpy()
+                labels = batch_scores.argmax(axis=1)
+                confidences = batch_scores[np.arange(len(labels)), labels]
+                for j, label, score, pos, neg, neu in zip(
+                    idx,
+                    labels.tolist(),
+                    confidences.tolist(),
+                    batch_scores[:, 2].tolist(),
+                    batch_scores[:, 0].tolist(),
+                    batch_scores[:, 1].tolist(),
+                ):
+                    results[j] = {
+                        "roberta_label": self._labels[label],
+                        "roberta_score": score,
+                        "roberta_positive": pos,
+                        "roberta_negative": neg,
+                        "roberta_neutral": neu,
+                    }
         return results
@@ -1,13 +1,15 @@
+import numpy as np
 import pandas as pd
 import logging
-from tqdm import tqdm
 
 from analyzers.preprocessor import TextPreprocessor
 from analyzers.vader_analyzer import VaderAnalyzer
-from analyzers.roberta_analyzer import RobertaAnalyzer
 
 logger = logging.getLogger(__name__)
 
+# Sentiment labels as int8 category codes for the charts' filters and groupbys
+LABEL_DTYPE = pd.CategoricalDtype(["positive", "negative", "neutral"])
+
 
 class SentimentPipeline:
     """Orchestrates preprocessing + VADER + RoBERTa into a single analysis flow."""
@@ -18,6 +20,9 @@ class SentimentPipeline:
         self.roberta = None
         if use_roberta:
             try:
+                # torch/transformers are only imported when RoBERTa is requested
+                from analyzers.roberta_analyzer import RobertaAnalyzer
+
                 self.roberta = RobertaAnalyzer()
             except Exception as e:
                 logger.warning(f"RoBERTa unavailable, using VADER only: {e}")
@@ -28,47 +33,47 @@ class SentimentPipeline:
 
         # Step 1: Preprocess
         logger.info("Step 1/3: Preprocessing text...")
-        df["clean_text"] = df.apply(
-            lambda r: self.preprocessor.preprocess(str(r.get("text", "")), str(r.get("platform", ""))),
-            axis=1,
-        )
+        text = df["text"].astype(str) if "text" in df.columns else pd.Series("", index=df.index)
+        platform = df["platform"].astype(str) if "platform" in df.columns else pd.Series("", index=df.index)
+        df["clean_text"] = self.preprocessor.preprocess_series(text, platform)
 
         # Step 2: VADER (fast)
         logger.info("Step 2/3: Running VADER analysis...")
-        iterator = tqdm(df["clean_text"], desc="VADER") if show_progress else df["clean_text"]
-        vader_results = [self.vader.analyze(text) for text in iterator]
-        vader_df = pd.DataFrame(vader_results)
-        for col in vader_df.columns:
-            df[col] = vader_df[col].values
+        texts = df["clean_text"].tolist()
+        if show_progress:
+            from tqdm import tqdm
+
+            texts = tqdm(texts, desc="VADER")
+        df = df.assign(**self.vader.analyze_many_arrays(texts))
 
         # Step 3: RoBERTa (slow, batched)
         if self.roberta:
             logger.info("Step 3/3: Running RoBERTa analysis...")
-            roberta_texts = df["clean_text"].apply(self.preprocessor.preprocess_for_roberta).tolist()
+            roberta_texts = self.preprocessor.preprocess_for_roberta_series(df["clean_text"]).tolist()
             roberta_results = self.roberta.analyze_batch(roberta_texts)
-            roberta_df = pd.DataFrame(roberta_results)
-            for col in roberta_df.columns:
-                df[col] = roberta_df[col].values
+            roberta_df = pd.DataFrame(roberta_results, index=df.index)
+            # assign (not concat) so re-analysing a frame overwrites its roberta_* columns
+            df = df.assign(**roberta_df)
         else:
             logger.info("Step 3/3: Skipping RoBERTa (not available)")
 
-        # Step 4: Ensemble
-        df["final_label"] = df.apply(self._ensemble_label, axis=1)
-        df["final_score"] = df.apply(self._ensemble_score, axis=1)
+        # Step 4: Ensemble (RoBERTa wins on disagreement; scores weighted 0.3/0.7)
+        vader_norm = (df["vader_compound"].to_numpy(dtype=float) + 1) * 0.5  # map -1..1 → 0..1
+        if self.roberta and "roberta_positive" in df.columns:
+            has_roberta = df["roberta_positive"].notna().to_numpy()
+            roberta_norm = (
+                df["roberta_positive"].to_numpy(dtype=float)
+                - df["roberta_negative"].to_numpy(dtype=float) + 1
+            ) * 0.5
+            df["final_score"] = np.where(has_roberta, 0.3 * vader_norm + 0.7 * roberta_norm, vader_norm)
+            final_label = np.where(
+                df["roberta_label"].notna().to_numpy(),
+                df["roberta_label"].to_numpy(),
+                df["vader_label"].to_numpy(),
+            )
+        else:
+            df["final_score"] = vader_norm
+            final_label = df["vader_label"].to_numpy()
+        df["final_label"] = pd.Categorical(final_label, dtype=LABEL_DTYPE)
 
         return df
-
-    def _ensemble_label(self, row) -> str:
-        if self.roberta and "roberta_label" in row and pd.notna(row.get("roberta_label")):
-            if row["vader_label"] == row["roberta_label"]:
-                return row["vader_label"]
-            return row["roberta_label"]  # RoBERTa wins on disagreement
-        return row["vader_label"]
-
-    def _ensemble_score(self, row) -> float:
-        vader_norm = (row["vader_compound"] + 1) / 2  # map -1..1 → 0..1
-        if self.roberta and "roberta_positive" in row and pd.notna(row.get("roberta_positive")):
-            roberta_score = row["roberta_positive"] - row["roberta_negative"]
-            roberta_norm = (roberta_score + 1) / 2
-            return 0.3 * vader_norm + 0.7 * roberta_norm
-        return vader_norm
@@ -1,14 +1,85 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 
+# Per-process analyzer, built once by the pool initializer
+_worker_analyzer = None
+
+
+def _init_worker():
+    global _worker_analyzer
+    _worker_analyzer = SentimentIntensityAnalyzer()
+
+
+def _score_worker(text: str) -> dict:
+    return _worker_analyzer.polarity_scores(text)
+
 
 class VaderAnalyzer:
     """Fast rule-based sentiment scoring using VADER."""
 
+    # Compound-score cut-offs for the positive / negative labels
+    POSITIVE_THRESHOLD = 0.05
+    NEGATIVE_THRESHOLD = -0.05
+    # Spawning a worker costs ~0.2 s against ~0.07 ms to score one text, so
+    # the pool only pays off for large uploads; collected runs stay serial
+    PARALLEL_MIN_TEXTS = 10_000
+    CHUNK_SIZE = 256
+
     def __init__(self):
         self.analyzer = SentimentIntensityAnalyzer()
 
     def analyze(self, text: str) -> dict:
-        scores = self.analyzer.polarity_scores(text)
+        return self._scores_to_result(self.analyzer.polarity_scores(text))
+
+    def analyze_many_arrays(self, texts: list) -> dict:
+        """Score many texts into parallel column arrays instead of per-row dicts."""
+        n = len(texts)
+        compound = np.empty(n, dtype=np.float64)
+        pos = np.empty(n, dtype=np.float64)
+        neg = np.empty(n, dtype=np.float64)
+        neu = np.empty(n, dtype=np.float64)
+        for i, scores in enumerate(self._iter_scores(texts)):
+            compound[i] = scores["compound"]
+            pos[i] = scores["pos"]
+            neg[i] = scores["neg"]
+            neu[i] = scores["neu"]
+
+        label = np.select(
+            [compound >= self.POSITIVE_THRESHOLD, compound <= self.NEGATIVE_THRESHOLD],
+            ["positive", "negative"],
+            default="neutral",
+        ).astype(object)
+        return {
+            "vader_compound": compound,
+            "vader_positive": pos,
+            "vader_negative": neg,
+            "vader_neutral": neu,
+            "vader_label": label,
+        }
+
+    def _iter_scores(self, texts: list):
+        """Yield raw polarity scores, spreading large inputs across CPU cores.
+
+        Workers are started with the "spawn" method so the Streamlit process
+        is never forked mid-session.
+        """
+        # No more workers than there are chunks to hand out
+        workers = min(os.cpu_count() or 1, -(-len(texts) // self.CHUNK_SIZE))
+        if len(texts) < self.PARALLEL_MIN_TEXTS or workers < 2:
+            for text in texts:
+                yield self.analyzer.polarity_scores(text)
+            return
+
+        ctx = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=ctx,
+                                 initializer=_init_worker) as executor:
+            yield from executor.map(_score_worker, texts, chunksize=self.CHUNK_SIZE)
+
+    def _scores_to_result(self, scores: dict) -> dict:
         return {
             "vader_compound": scores["compound"],
             "vader_positive": scores["pos"],
@@ -17,10 +88,10 @@ class VaderAnalyzer:
             "vader_label": self._compound_to_label(scores["compound"]),
         }
 
-    @staticmethod
-    def _compound_to_label(compound: float) -> str:
-        if compound >= 0.05:
+    @classmethod
+    def _compound_to_label(cls, compound: float) -> str:
+        if compound >= cls.POSITIVE_THRESHOLD:
             return "positive"
-        elif compound <= -0.05:
+        elif compound <= cls.NEGATIVE_THRESHOLD:
             return "negative"
         return "neutral"
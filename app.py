@@ -240,6 +240,10 @@ if upload_btn:
         upload_progress.progress(0.7, text="Analyzing text...")
 
         result = pipeline.analyze_dataframe(combined, show_progress=False)
+
+        # Bucket dates once so the Trends tab doesn't redo it on every rerun
+        from utils.chart_helpers import prepare_time_columns
+        result = prepare_time_columns(result)
         upload_progress.progress(1.0, text="Analysis complete!")
 
     # Store in session state
@@ -298,6 +302,10 @@ if analyze_btn:
         analysis_bar.progress(0.3, text="Analyzing text...")
 
         result = pipeline.analyze_dataframe(combined, show_progress=False)
+
+        # Bucket dates once so the Trends tab doesn't redo it on every rerun
+        from utils.chart_helpers import prepare_time_columns
+        result = prepare_time_columns(result)
         analysis_bar.progress(1.0, text="Analysis complete!")
 
     # Store in session state
@@ -320,7 +328,7 @@ if "results" in st.session_state:
         sentiment_timeline, vader_vs_roberta_scatter, platform_comparison_radar,
         sentiment_heatmap, confidence_distribution, text_length_vs_sentiment,
         volume_over_time, engagement_by_sentiment, top_texts_table,
-        SENTIMENT_COLORS, PLATFORM_COLORS,
+        SENTIMENT_COLORS, PLATFORM_COLORS, TIME_COLUMNS,
     )
     from utils.wordcloud_helper import display_sentiment_wordclouds
     import plotly.express as px
@@ -349,7 +357,7 @@ if "results" in st.session_state:
     summary_parts = [f"**Dominant sentiment: {dominant}** ({dominant_pct:.1f}% of texts)."]
 
     if num_platforms > 1:
-        platform_dominant = df.groupby("platform")[label_col].agg(lambda x: x.value_counts().idxmax())
+        platform_dominant = df.groupby("platform", observed=True)[label_col].agg(lambda x: x.value_counts().idxmax())
         comparisons = [f"{p}: {s}" for p, s in platform_dominant.items()]
         summary_parts.append(f"Platform breakdown — {', '.join(comparisons)}.")
 
@@ -558,7 +566,7 @@ if "results" in st.session_state:
         with dl1:
             st.download_button(
                 "📥 Download CSV",
-                filtered.to_csv(index=False),
+                filtered.drop(columns=TIME_COLUMNS, errors="ignore").to_csv(index=False),
                 file_name=f"sentiment_{kw.replace(' ', '_')}.csv",
                 mime="text/csv",
                 use_container_width=True,
@@ -1,15 +1,50 @@
+import asyncio
 import pandas as pd
 import cloudscraper
+import lxml.etree
+import lxml.html
 import logging
-import time
 import hashlib
 from datetime import datetime
+from lxml.cssselect import CSSSelector
 from urllib.parse import quote_plus
 
 from collectors.base_collector import BaseCollector
+from utils.rate_limit import RetryableResponse, RETRY_STATUSES, retry_after_seconds, retry_async
 
 logger = logging.getLogger(__name__)
 
+# CSS selectors compiled to XPath once at import instead of on every query
+_SEL_ASIN = CSSSelector("[data-asin]")
+_SEL_PRODUCT_TITLE = CSSSelector("#productTitle")
+_SEL_REVIEW = CSSSelector(".a-section.celwidget")
+_SEL_BODY = CSSSelector('span[data-hook="review-body"]')
+_SEL_TITLE = CSSSelector('a[data-hook="review-title"] > span')
+_SEL_RATING = CSSSelector(
+    'i[data-hook="review-star-rating"] .a-icon-alt, i.review-rating .a-icon-alt'
+)
+_SEL_AUTHOR = CSSSelector(".a-profile-content .a-profile-name")
+_SEL_DATE = CSSSelector('span[data-hook="review-date"]')
+
+
+def _first_text(selector: CSSSelector, node) -> str:
+    """Stripped text of the first match under node, or "" if there is none."""
+    matches = selector(node)
+    return matches[0].text_content().strip() if matches else ""
+
+
+def _is_focal_reviews(elem) -> bool:
+    return "cr-widget-FocalReviews" in (elem.get("class") or "").split()
+
+
+def _drop_finished(elem):
+    """Free an element the pull parser has finished, and its earlier siblings."""
+    elem.clear(keep_tail=True)
+    parent = elem.getparent()
+    if parent is not None:
+        while elem.getprevious() is not None:
+            del parent[0]
+
 
 class AmazonCollector(BaseCollector):
     """Collects Amazon.in product reviews by searching for a keyword.
@@ -18,36 +53,33 @@ class AmazonCollector(BaseCollector):
     from each product page's FocalReviews widget.
     """
 
+    MAX_PRODUCTS = 8
+    MAX_CONCURRENCY = 4
+    POOL_LIMIT_PER_HOST = MAX_CONCURRENCY
+    STREAM_CHUNK_SIZE = 64 * 1024
+
     def _get_scraper(self):
         return cloudscraper.create_scraper()
 
     def collect(self, query: str, limit: int = 100, **kwargs) -> pd.DataFrame:
-        from bs4 import BeautifulSoup
-
         scraper = self._get_scraper()
 
         # Step 1: Search Amazon.in for the keyword
-        asins = self._search_products(query, scraper, BeautifulSoup)
+        asins = self._search_products(query, scraper)
         if not asins:
             logger.warning(f"No Amazon products found for '{query}'")
             return self._empty_df()
 
         logger.info(f"Found {len(asins)} products, scraping reviews...")
 
-        # Step 2: Scrape reviews from each product page
-        all_rows = []
-        for asin in asins[:8]:
-            rows = self._scrape_product_reviews(asin, scraper, BeautifulSoup)
-            all_rows.extend(rows)
-            if len(all_rows) >= limit:
-                break
-            time.sleep(2)
+        # Step 2: Scrape reviews from the product pages concurrently
+        all_rows = asyncio.run(self._scrape_products(asins[:self.MAX_PRODUCTS], scraper, limit))
 
-        df = pd.DataFrame(all_rows[:limit])
+        df = self._build_df(all_rows[:limit])
         logger.info(f"Amazon: collected {len(df)} reviews for '{query}'")
-        return self._validate(df)
+        return df
 
-    def _search_products(self, query: str, scraper, BeautifulSoup) -> list:
+    def _search_products(self, query: str, scraper) -> list:
         """Search Amazon.in and return a list of ASINs."""
         url = f"https://www.amazon.in/s?k={quote_plus(query)}"
 
@@ -57,10 +89,10 @@ class AmazonCollector(BaseCollector):
                 logger.warning(f"Amazon search returned {resp.status_code}")
                 return []
 
-            soup = BeautifulSoup(resp.text, "lxml")
+            tree = lxml.html.fromstring(resp.content)
 
             asins = []
-            for item in soup.select('[data-asin]'):
+            for item in _SEL_ASIN(tree):
                 asin = item.get("data-asin", "").strip()
                 if asin and len(asin) == 10:
                     asins.append(asin)
@@ -71,68 +103,113 @@ class AmazonCollector(BaseCollector):
             logger.error(f"Amazon search failed: {e}")
             return []
 
-    def _scrape_product_reviews(self, asin: str, scraper, BeautifulSoup) -> list:
-        """Scrape reviews from a product page (/dp/ASIN)."""
-        url = f"https://www.amazon.in/dp/{asin}"
-        rows = []
+    async def _scrape_products(self, asins: list, scraper, limit: int) -> list:
+        """Fetch product pages concurrently, reusing the search session's
+        User-Agent and Cloudflare clearance cookies.
 
-        try:
-            resp = scraper.get(url, timeout=15)
-            if resp.status_code != 200:
-                return rows
-
-            soup = BeautifulSoup(resp.text, "lxml")
+        Pages are consumed as they finish; once `limit` reviews are in, the
+        remaining fetches are cancelled.
+        """
+        headers = {"User-Agent": scraper.headers.get("User-Agent", "")}
+        cookies = scraper.cookies.get_dict()
+        sem = asyncio.Semaphore(self.MAX_CONCURRENCY)
 
-            # Get product title
-            title_el = soup.select_one("#productTitle")
-            product_title = title_el.get_text(strip=True) if title_el else ""
+        async def bounded(asin, session):
+            async with sem:
+                return await self._scrape_product_reviews_async(asin, session)
 
-            # Reviews are in .cr-widget-FocalReviews as .celwidget divs
-            focal = soup.select_one(".cr-widget-FocalReviews")
-            if not focal:
-                return rows
+        rows = []
+        async with self._client_session(headers=headers, cookies=cookies) as session:
+            tasks = [asyncio.create_task(bounded(asin, session)) for asin in asins]
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    rows.extend(await next_done)
+                    if len(rows) >= limit:
+                        break
+            finally:
+                for task in tasks:
+                    task.cancel()
+                # Let cancelled fetches unwind before the session closes
+                await asyncio.gather(*tasks, return_exceptions=True)
+        return rows
 
-            review_divs = focal.select(".a-section.celwidget")
+    async def _scrape_product_reviews_async(self, asin: str, session) -> list:
+        """Fetch a product page (/dp/ASIN) and parse its reviews."""
+        url = f"https://www.amazon.in/dp/{asin}"
+        try:
+            page = await self._fetch_focal_reviews(session, url)
+        except Exception as e:
+            logger.debug(f"Product page fetch failed for {asin}: {e}")
+            return []
+        return self._parse_product_reviews(*page, asin) if page else []
+
+    @retry_async(max_retries=2)
+    async def _fetch_focal_reviews(self, session, url: str):
+        """Stream a product page into a pull parser and stop at the reviews.
+
+        Returns (product_title, FocalReviews element), or None when the page
+        couldn't be fetched. Elements that finish before the widget are
+        cleared as they go, so the full page tree is never held in memory.
+        """
+        async with session.get(url) as resp:
+            if resp.status in RETRY_STATUSES:
+                raise RetryableResponse(resp.status, retry_after_seconds(resp.headers))
+            if resp.status != 200:
+                return None
+
+            parser = lxml.etree.HTMLPullParser(events=("start", "end"))
+            parser.set_element_class_lookup(lxml.html.HtmlElementClassLookup())
+            product_title = ""
+            focal = None
+
+            async for chunk in resp.content.iter_chunked(self.STREAM_CHUNK_SIZE):
+                parser.feed(chunk)
+                for event, elem in parser.read_events():
+                    if focal is None:
+                        if event == "start" and _is_focal_reviews(elem):
+                            focal = elem
+                        elif event == "end":
+                            if elem.get("id") == "productTitle":
+                                product_title = elem.text_content().strip()
+                            _drop_finished(elem)
+                    elif event == "end" and elem is focal:
+                        # Rest of the page isn't needed; leaving the block closes the response
+                        return product_title, focal
+        return product_title, focal
+
+    def _parse_product_reviews(self, product_title: str, focal, asin: str) -> list:
+        """Extract reviews from a product page's FocalReviews widget."""
+        rows = []
+        if focal is None:
+            return rows
 
-            for review in review_divs:
+        try:
+            # Reviews are .celwidget divs inside the widget
+            for review in _SEL_REVIEW(focal):
                 # Body: span[data-hook="review-body"] contains the review text
-                body_el = review.select_one('span[data-hook="review-body"]')
-                if not body_el:
-                    continue
-                body_text = body_el.get_text(strip=True)
+                body_text = _first_text(_SEL_BODY, review)
                 body_text = body_text.replace("Read more", "").replace("Read less", "").strip()
 
                 if not body_text or len(body_text) < 5:
                     continue
 
-                # Title: a[data-hook="review-title"] > last span (skip rating spans)
+                # Title: last direct-child span of the title link (skip rating spans)
                 review_title = ""
-                title_link = review.select_one('a[data-hook="review-title"]')
-                if title_link:
-                    spans = title_link.find_all("span", recursive=False)
-                    for span in spans:
-                        t = span.get_text(strip=True)
-                        if t and "out of" not in t and t.strip():
-                            review_title = t
+                for span in _SEL_TITLE(review):
+                    t = span.text_content().strip()
+                    if t and "out of" not in t:
+                        review_title = t
 
                 text = f"{review_title}. {body_text}" if review_title else body_text
 
                 # Rating
-                rating = ""
-                rating_el = review.select_one(
-                    'i[data-hook="review-star-rating"] .a-icon-alt, '
-                    'i.review-rating .a-icon-alt'
-                )
-                if rating_el:
-                    rating = rating_el.get_text(strip=True).split()[0]
-
-                # Author
-                author_el = review.select_one(".a-profile-content .a-profile-name")
-                author = author_el.get_text(strip=True) if author_el else "Amazon Customer"
+                rating_text = _first_text(_SEL_RATING, review)
+                rating = rating_text.split()[0] if rating_text else ""
+
+                author = _first_text(_SEL_AUTHOR, review) or "Amazon Customer"
 
                 # Date
-                date_el = review.select_one('span[data-hook="review-date"]')
-                date_text = date_el.get_text(strip=True) if date_el else ""
+                date_text = _first_text(_SEL_DATE, review)
                 try:
                     date_clean = date_text.split(" on ")[-1] if " on " in date_text else date_text
                     date = pd.to_datetime(date_clean, dayfirst=True, errors="coerce")
@@ -142,7 +219,7 @@ class AmazonCollector(BaseCollector):
                     date = datetime.now()
 
                 rows.append({
-                    "id": hashlib.md5(text[:100].encode()).hexdigest(),
+                    "id": hashlib.blake2b(text[:100].encode(), digest_size=8).hexdigest(),
                     "text": text,
                     "date": date,
                     "author": author,
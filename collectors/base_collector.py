@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 import pandas as pd
+import aiohttp
 import logging
 
 logger = logging.getLogger(__name__)
@@ -15,20 +16,58 @@ class BaseCollector(ABC):
         author   : str       - Username / source name
         platform : str       - "twitter" | "reddit" | "news" | "amazon"
         metadata : dict      - Platform-specific extras
+        text_length : int32  - len(text), added by `_validate`
     """
 
     SCHEMA_COLUMNS = ["id", "text", "date", "author", "platform", "metadata"]
+    # Fixed categories, so frames from different collectors concatenate as one categorical
+    PLATFORM_DTYPE = pd.CategoricalDtype(["twitter", "reddit", "amazon", "news"])
+    # Extra pd.to_datetime arguments for the raw "date" values a collector emits
+    DATE_PARSE = {}
+
+    # Connection pool shared by every request a collector makes in one collect()
+    POOL_LIMIT = 8
+    POOL_LIMIT_PER_HOST = 4
+    KEEPALIVE_SECONDS = 30
+    REQUEST_TIMEOUT = 15
 
     @abstractmethod
     def collect(self, query: str, limit: int = 500, **kwargs) -> pd.DataFrame:
         """Collect data and return a DataFrame with the uniform schema."""
 
+    def _client_session(self, headers: dict = None, cookies: dict = None) -> aiohttp.ClientSession:
+        """HTTP session with a keep-alive connection pool, so paginated and
+        concurrent requests reuse TCP/TLS connections instead of reconnecting.
+        Must be created inside the running event loop."""
+        connector = aiohttp.TCPConnector(
+            limit=self.POOL_LIMIT,
+            limit_per_host=self.POOL_LIMIT_PER_HOST,
+            keepalive_timeout=self.KEEPALIVE_SECONDS,
+            ttl_dns_cache=300,
+        )
+        return aiohttp.ClientSession(
+            headers=headers, cookies=cookies, connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.REQUEST_TIMEOUT),
+        )
+
+    def _build_df(self, rows: list) -> pd.DataFrame:
+        """Build the uniform-schema DataFrame from collected row dicts in one pass."""
+        if not rows:
+            return self._empty_df()
+        return self._validate(pd.DataFrame.from_records(rows, columns=self.SCHEMA_COLUMNS))
+
     def _validate(self, df: pd.DataFrame) -> pd.DataFrame:
-        for col in self.SCHEMA_COLUMNS:
-            if col not in df.columns:
-                df[col] = None
-        df["date"] = pd.to_datetime(df["date"], errors="coerce")
-        return df[self.SCHEMA_COLUMNS]
+        # One reindex adds any missing columns instead of inserting them one by one
+        df = df.reindex(columns=self.SCHEMA_COLUMNS)
+        # Parse the whole column at once; stored as naive UTC so frames from
+        # different platforms concatenate into one datetime64 column
+        dates = pd.to_datetime(df["date"], errors="coerce", utc=True, **self.DATE_PARSE)
+        df["date"] = dates.fillna(pd.Timestamp.now(tz="UTC")).dt.tz_localize(None)
+        # int8 category codes for the charts' platform filters and groupbys
+        df["platform"] = df["platform"].astype(self.PLATFORM_DTYPE)
+        # Text never changes after collection, so measure it once here rather than per chart render
+        df["text_length"] = df["text"].fillna("").astype(str).str.len().astype("int32")
+        return df
 
     def _empty_df(self) -> pd.DataFrame:
         return pd.DataFrame(columns=self.SCHEMA_COLUMNS)
@@ -1,10 +1,14 @@
+import asyncio
 import pandas as pd
-import requests
+import aiohttp
+import orjson
 import logging
-import time
-from datetime import datetime
+from urllib.parse import urlparse
 
 from collectors.base_collector import BaseCollector
+from utils.rate_limit import (
+    HostRateLimiter, RetryableResponse, RETRY_STATUSES, retry_after_seconds, retry_async,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -16,11 +20,49 @@ class RedditCollector(BaseCollector):
     HEADERS = {
         "User-Agent": "SentimentAnalyzer/2.0 (keyword search tool)",
     }
+    # Sort modes tried, after the requested one, to top up results when it runs out of pages
+    SORTS = ("relevance", "new", "hot")
+    # Rows keep the raw created_utc epoch seconds; _validate converts them in one go
+    DATE_PARSE = {"unit": "s"}
+
+    def __init__(self):
+        # Reddit doesn't always send rate-limit headers; space those requests out
+        self._limiter = HostRateLimiter(fallback_interval=1.5)
 
     def collect(self, query: str, limit: int = 100,
                 sort: str = "relevance", time_filter: str = "month", **kwargs) -> pd.DataFrame:
+        sorts = [sort] + [s for s in self.SORTS if s != sort]
+        rows = asyncio.run(self._collect_async(query, limit, sorts, time_filter))
+
+        df = self._build_df(rows[:limit])
+        logger.info(f"Reddit: collected {len(df)} posts for '{query}'")
+        return df
+
+    async def _collect_async(self, query: str, limit: int, sorts: list, time_filter: str) -> list:
+        """Page through the requested sort; the other sorts are only searched,
+        one after another, if it runs out before `limit`. Posts are deduped by id."""
+        seen = set()
+        rows = []
+        async with self._client_session(headers=self.HEADERS) as session:
+            for sort in sorts:
+                sort_rows, exhausted = await self._search_sort(
+                    session, query, limit - len(rows), sort, time_filter, seen
+                )
+                rows += sort_rows
+                # Errors and rate-limit stops shouldn't spill over into more searches
+                if len(rows) >= limit or not exhausted:
+                    break
+        return rows
+
+    async def _search_sort(self, session, query: str, limit: int,
+                           sort: str, time_filter: str, seen: set) -> list:
+        """Collect up to `limit` posts not already in `seen`, adding their ids to it.
+
+        Returns (rows, exhausted), where exhausted means the search ran out of pages.
+        """
         rows = []
         after = None
+        host = urlparse(self.BASE_URL).netloc
 
         while len(rows) < limit:
             params = {
@@ -33,63 +75,63 @@ class RedditCollector(BaseCollector):
             if after:
                 params["after"] = after
 
-            try:
-                resp = requests.get(
-                    self.BASE_URL, headers=self.HEADERS,
-                    params=params, timeout=15,
-                )
-
-                if resp.status_code == 429:
-                    logger.warning("Reddit rate limited, waiting 10s...")
-                    time.sleep(10)
-                    continue
-
-                if resp.status_code != 200:
-                    logger.error(f"Reddit returned status {resp.status_code}")
-                    break
-
-                data = resp.json().get("data", {})
-                children = data.get("children", [])
-
-                if not children:
-                    break
-
-                for child in children:
-                    post = child.get("data", {})
-                    title = post.get("title", "")
-                    selftext = post.get("selftext", "")
-                    text = f"{title}. {selftext}".strip() if selftext else title
-
-                    created = post.get("created_utc", 0)
-                    try:
-                        date = datetime.utcfromtimestamp(created)
-                    except (ValueError, OSError):
-                        date = datetime.now()
-
-                    rows.append({
-                        "id": post.get("id", ""),
-                        "text": text,
-                        "date": date,
-                        "author": post.get("author", "[deleted]"),
-                        "platform": "reddit",
-                        "metadata": {
-                            "score": post.get("score", 0),
-                            "num_comments": post.get("num_comments", 0),
-                            "subreddit": post.get("subreddit", ""),
-                            "url": f"https://reddit.com{post.get('permalink', '')}",
-                        },
-                    })
-
-                after = data.get("after")
-                if not after:
-                    break
-
-                time.sleep(1.5)
+            if not await self._limiter.wait(host):
+                logger.warning("Reddit rate limit window is too long, stopping early")
+                break
 
-            except requests.RequestException as e:
+            try:
+                data = await self._get_page(session, host, params)
+            except RetryableResponse as e:
+                logger.error(f"Reddit returned status {e.status} after retries")
+                break
+            except (aiohttp.ClientError, asyncio.TimeoutError, orjson.JSONDecodeError) as e:
                 logger.error(f"Reddit request failed: {e}")
                 break
 
-        df = pd.DataFrame(rows[:limit])
-        logger.info(f"Reddit: collected {len(df)} posts for '{query}'")
-        return self._validate(df)
+            if data is None:
+                break
+
+            children = data.get("children", [])
+            if not children:
+                return rows, True
+
+            for child in children:
+                post = child.get("data", {})
+                post_id = post.get("id", "")
+                if post_id in seen:
+                    continue
+                seen.add(post_id)
+                title = post.get("title", "")
+                selftext = post.get("selftext", "")
+                text = f"{title}. {selftext}".strip() if selftext else title
+
+                rows.append({
+                    "id": post_id,
+                    "text": text,
+                    "date": post.get("created_utc", 0),
+                    "author": post.get("author", "[deleted]"),
+                    "platform": "reddit",
+                    "metadata": {
+                        "score": post.get("score", 0),
+                        "num_comments": post.get("num_comments", 0),
+                        "subreddit": post.get("subreddit", ""),
+                        "url": f"https://reddit.com{post.get('permalink', '')}",
+                    },
+                })
+
+            after = data.get("after")
+            if not after:
+                return rows, True
+
+        return rows, False
+
+    @retry_async()
+    async def _get_page(self, session, host: str, params: dict):
+        async with session.get(self.BASE_URL, params=params) as resp:
+            self._limiter.update(host, resp.headers)
+            if resp.status in RETRY_STATUSES:
+                raise RetryableResponse(resp.status, retry_after_seconds(resp.headers))
+            if resp.status != 200:
+                logger.error(f"Reddit returned status {resp.status}")
+                return None
+            return orjson.loads(await resp.read()).get("data", {})
@@ -1,19 +1,29 @@
+import asyncio
 import pandas as pd
+import orjson
 import logging
 import os
-import requests
-from datetime import datetime
 
 from collectors.base_collector import BaseCollector
+from utils.rate_limit import (
+    HostRateLimiter, RetryableResponse, RETRY_STATUSES, retry_after_seconds, retry_async,
+)
 
 logger = logging.getLogger(__name__)
 
-SEARCH_URL = "https://api.twitter.com/2/tweets/search/recent"
+API_HOST = "api.twitter.com"
+SEARCH_URL = f"https://{API_HOST}/2/tweets/search/recent"
 
 
 class TwitterCollector(BaseCollector):
     """Collects tweets from X.com via the Twitter API v2 (Bearer Token)."""
 
+    # Rows keep the raw created_at strings; _validate converts them in one go
+    DATE_PARSE = {"format": "ISO8601"}
+
+    def __init__(self):
+        self._limiter = HostRateLimiter()
+
     def collect(self, query: str, limit: int = 100, **kwargs):
         # Get bearer token
         try:
@@ -30,12 +40,12 @@ class TwitterCollector(BaseCollector):
             return self._empty_df()
 
         try:
-            return self._fetch_tweets(query, limit, bearer_token)
+            return asyncio.run(self._fetch_tweets(query, limit, bearer_token))
         except Exception as e:
             logger.error(f"X.com collection failed: {e}")
             return self._empty_df()
 
-    def _fetch_tweets(self, query: str, limit: int, bearer_token: str) -> pd.DataFrame:
+    async def _fetch_tweets(self, query: str, limit: int, bearer_token: str) -> pd.DataFrame:
         headers = {"Authorization": f"Bearer {bearer_token}"}
 
         params = {
@@ -49,64 +59,74 @@ class TwitterCollector(BaseCollector):
         rows = []
         next_token = None
 
-        while len(rows) < limit:
-            if next_token:
-                params["next_token"] = next_token
+        async with self._client_session(headers=headers) as session:
+            while len(rows) < limit:
+                if next_token:
+                    params["next_token"] = next_token
 
-            resp = requests.get(SEARCH_URL, headers=headers, params=params, timeout=15)
+                # Sleeps only once x-rate-limit-remaining runs low
+                if not await self._limiter.wait(API_HOST):
+                    logger.warning("X.com API: Rate limit window exhausted.")
+                    break
 
-            if resp.status_code == 401:
-                logger.error("X.com API: Invalid Bearer Token.")
-                return self._empty_df()
-            if resp.status_code == 429:
-                logger.warning("X.com API: Rate limit reached.")
-                break
-            resp.raise_for_status()
+                status, data = await self._get_page(session, params)
+                if status == 401:
+                    logger.error("X.com API: Invalid Bearer Token.")
+                    return self._empty_df()
+                if status == 429:
+                    # X.com windows are 15 minutes long; don't block the UI retrying
+                    logger.warning("X.com API: Rate limit reached.")
+                    break
 
-            data = resp.json()
-            tweets = data.get("data", [])
-            if not tweets:
-                break
-
-            # Build author lookup from includes
-            users = {u["id"]: u["username"] for u in data.get("includes", {}).get("users", [])}
-
-            for tweet in tweets:
-                text = tweet.get("text", "")
-                if not text.strip():
-                    continue
-
-                author_id = tweet.get("author_id", "")
-                author_name = users.get(author_id, "unknown")
-
-                created = tweet.get("created_at", "")
-                try:
-                    date = datetime.fromisoformat(created.replace("Z", "+00:00"))
-                except (ValueError, TypeError, AttributeError):
-                    date = datetime.now()
-
-                metrics = tweet.get("public_metrics", {})
-
-                rows.append({
-                    "id": tweet.get("id", ""),
-                    "text": text,
-                    "date": date,
-                    "author": f"@{author_name}",
-                    "platform": "twitter",
-                    "metadata": {
-                        "likes": metrics.get("like_count", 0),
-                        "retweets": metrics.get("retweet_count", 0),
-                        "replies": metrics.get("reply_count", 0),
-                    },
-                })
-
-                if len(rows) >= limit:
+                tweets = data.get("data", [])
+                if not tweets:
                     break
 
-            next_token = data.get("meta", {}).get("next_token")
-            if not next_token:
-                break
+                # Build author lookup from includes
+                users = {u["id"]: u["username"] for u in data.get("includes", {}).get("users", [])}
+
+                for tweet in tweets:
+                    text = tweet.get("text", "")
+                    if not text.strip():
+                        continue
+
+                    author_id = tweet.get("author_id", "")
+                    author_name = users.get(author_id, "unknown")
+
+                    metrics = tweet.get("public_metrics", {})
+
+                    rows.append({
+                        "id": tweet.get("id", ""),
+                        "text": text,
+                        "date": tweet.get("created_at"),
+                        "author": f"@{author_name}",
+                        "platform": "twitter",
+                        "metadata": {
+                            "likes": metrics.get("like_count", 0),
+                            "retweets": metrics.get("retweet_count", 0),
+                            "replies": metrics.get("reply_count", 0),
+                        },
+                    })
+
+                    if len(rows) >= limit:
+                        break
+
+                next_token = data.get("meta", {}).get("next_token")
+                if not next_token:
+                    break
 
-        df = pd.DataFrame(rows)
+        df = self._build_df(rows)
         logger.info(f"X.com: collected {len(df)} tweets")
-        return self._validate(df) if not df.empty else self._empty_df()
+        return df
+
+    @retry_async()
+    async def _get_page(self, session, params: dict) -> tuple:
+        """Fetch one search page, retrying transient 5xx errors. Returns (status, json)."""
+        async with session.get(SEARCH_URL, params=params) as resp:
+            self._limiter.update(API_HOST, resp.headers)
+            if resp.status in (401, 429):
+                return resp.status, None
+            if resp.status in RETRY_STATUSES:
+                raise RetryableResponse(resp.status, retry_after_seconds(resp.headers))
+            resp.raise_for_status()
+            return resp.status, orjson.loads(await resp.read())
@@ -21,6 +21,11 @@ TWITTER_BEARER_TOKEN = os.getenv("TWITTER_BEARER_TOKEN", "")
 
 # Sentiment model
 ROBERTA_MODEL = "cardiffnlp/twitter-roberta-base-sentiment-latest"
+# Run RoBERTa through ONNX Runtime (requires optimum[onnxruntime])
+ROBERTA_USE_ONNX = os.getenv("ROBERTA_USE_ONNX", "").lower() in ("1", "true", "yes")
+MODEL_CACHE_DIR = Path.home() / ".cache" / "sentiment-analyzer"
+# CPU threads for RoBERTa inference (lower this when running several replicas per host)
+TORCH_NUM_THREADS = int(os.getenv("SENTIMENT_TORCH_THREADS") or os.cpu_count() or 1)
 
 # Platforms
 PLATFORMS = ["twitter", "reddit", "amazon"]
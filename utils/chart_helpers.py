@@ -1,5 +1,6 @@
 import plotly.express as px
 import plotly.graph_objects as go
+import numpy as np
 import pandas as pd
 
 # Consistent color palette
@@ -15,6 +16,38 @@ PLATFORM_COLORS = {
     "amazon": "#FF9900",
 }
 
+# Time buckets offered by the Trends tab
+TIME_FREQS = ("D", "W", "M")
+TIME_COLUMNS = [f"period_{freq}" for freq in TIME_FREQS]
+
+
+def prepare_time_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Add period_D / period_W / period_M bucket columns once, so the time
+    charts don't each recompute `to_period` on every render."""
+    if "date" not in df.columns or not pd.api.types.is_datetime64_any_dtype(df["date"]):
+        return df
+    return df.assign(**{
+        f"period_{freq}": df["date"].dt.to_period(freq).dt.to_timestamp() for freq in TIME_FREQS
+    })
+
+
+def _period_column(df: pd.DataFrame, freq: str) -> pd.Series:
+    col = f"period_{freq}"
+    if col in df.columns:
+        return df[col]
+    return df["date"].dt.to_period(freq).dt.to_timestamp()
+
+
+def _dated_frame(df: pd.DataFrame, freq: str, period_name: str, **columns) -> pd.DataFrame:
+    """Narrow frame of a period column plus the given columns for dated rows.
+
+    Built from masked arrays so the charts never copy the full result frame.
+    """
+    mask = df["date"].notna().to_numpy()
+    data = {period_name: _period_column(df, freq).to_numpy()[mask]}
+    data.update({name: df[col].to_numpy()[mask] for name, col in columns.items()})
+    return pd.DataFrame(data)
+
 
 def sentiment_distribution_bar(df: pd.DataFrame, label_col: str = "final_label",
                                 group_by: str = "platform") -> go.Figure:
@@ -22,7 +55,13 @@ def sentiment_distribution_bar(df: pd.DataFrame, label_col: str = "final_label",
     if df.empty:
         return _empty_figure("No data available")
 
-    counts = df.groupby([group_by, label_col]).size().reset_index(name="count")
+    # One tabulation pass; zero cells dropped so absent pairs get no bar
+    counts = (
+        pd.crosstab(df[group_by], df[label_col])
+        .reset_index()
+        .melt(id_vars=group_by, var_name=label_col, value_name="count")
+    )
+    counts = counts[counts["count"] > 0]
     fig = px.bar(
         counts, x=group_by, y="count", color=label_col,
         barmode="group",
@@ -40,6 +79,7 @@ def sentiment_pie(df: pd.DataFrame, label_col: str = "final_label") -> go.Figure
 
     counts = df[label_col].value_counts().reset_index()
     counts.columns = ["sentiment", "count"]
+    counts = counts[counts["count"] > 0]  # categorical labels also list unused categories
     fig = px.pie(
         counts, values="count", names="sentiment",
         color="sentiment",
@@ -56,9 +96,7 @@ def sentiment_timeline(df: pd.DataFrame, score_col: str = "final_score",
     if df.empty or "date" not in df.columns:
         return _empty_figure("No data available")
 
-    df_ts = df.dropna(subset=["date"]).copy()
-    df_ts["period"] = df_ts["date"].dt.to_period(freq).dt.to_timestamp()
-
+    df_ts = _dated_frame(df, freq, "period", **{color_by: color_by, score_col: score_col})
     agg = df_ts.groupby(["period", color_by])[score_col].mean().reset_index()
     fig = px.line(
         agg, x="period", y=score_col, color=color_by,
@@ -105,23 +143,19 @@ def platform_comparison_radar(df: pd.DataFrame, label_col: str = "final_label")
     if df.empty:
         return _empty_figure("No data available")
 
-    platforms = df["platform"].unique()
-    fig = go.Figure()
+    platforms = list(df["platform"].unique())
+    # One tabulation gives every platform's sentiment share
+    ratios = pd.crosstab(df["platform"], df[label_col], normalize="index") * 100
+    ratios = ratios.reindex(index=platforms, columns=["positive", "negative", "neutral"], fill_value=0)
 
-    for sentiment in ["positive", "negative", "neutral"]:
-        values = []
-        for platform in platforms:
-            platform_df = df[df["platform"] == platform]
-            if len(platform_df) > 0:
-                ratio = (platform_df[label_col] == sentiment).sum() / len(platform_df)
-                values.append(ratio * 100)
-            else:
-                values.append(0)
+    fig = go.Figure()
+    for sentiment in ratios.columns:
+        values = ratios[sentiment].tolist()
         values.append(values[0])  # close the radar
 
         fig.add_trace(go.Scatterpolar(
             r=values,
-            theta=list(platforms) + [platforms[0]],
+            theta=platforms + [platforms[0]],
             fill="toself",
             name=sentiment,
             line_color=SENTIMENT_COLORS[sentiment],
@@ -139,17 +173,17 @@ def sentiment_heatmap(df: pd.DataFrame, label_col: str = "final_label") -> go.Fi
     if df.empty or "date" not in df.columns:
         return _empty_figure("No data available")
 
-    df_h = df.dropna(subset=["date"]).copy()
-    df_h["month"] = df_h["date"].dt.to_period("M").astype(str)
-    df_h["is_positive"] = (df_h[label_col] == "positive").astype(int)
-
-    pivot = df_h.groupby(["platform", "month"])["is_positive"].mean().reset_index()
-    pivot_table = pivot.pivot(index="platform", columns="month", values="is_positive")
+    df_h = _dated_frame(df, "M", "month", platform="platform", label=label_col)
+    # Positive share per platform x month cell, tabulated in one pass
+    pivot_table = pd.crosstab(
+        df_h["platform"], df_h["month"],
+        values=(df_h["label"] == "positive").to_numpy(), aggfunc="mean",
+    )
 
     fig = px.imshow(
         pivot_table.values * 100,
         labels=dict(x="Month", y="Platform", color="Positive %"),
-        x=list(pivot_table.columns),
+        x=[month.strftime("%Y-%m") for month in pivot_table.columns],
         y=list(pivot_table.index),
         color_continuous_scale="RdYlGn",
         title="Positive Sentiment % by Platform & Month",
@@ -178,9 +212,12 @@ def text_length_vs_sentiment(df: pd.DataFrame, label_col: str = "final_label") -
     if df.empty or label_col not in df.columns:
         return _empty_figure("No data available")
 
-    df_plot = df.copy()
-    text_col = "clean_text" if "clean_text" in df_plot.columns else "text"
-    df_plot["text_length"] = df_plot[text_col].astype(str).str.len()
+    if "text_length" in df.columns:
+        lengths = df["text_length"]
+    else:
+        # Uploaded files skip the collectors, which precompute this
+        lengths = df["text"].astype(str).str.len()
+    df_plot = pd.DataFrame({label_col: df[label_col].to_numpy(), "text_length": lengths.to_numpy()})
 
     fig = px.violin(
         df_plot, x=label_col, y="text_length", color=label_col,
@@ -198,11 +235,10 @@ def volume_over_time(df: pd.DataFrame, label_col: str = "final_label",
     if df.empty or "date" not in df.columns:
         return _empty_figure("No date data available")
 
-    df_ts = df.dropna(subset=["date"]).copy()
+    df_ts = _dated_frame(df, freq, "period", **{label_col: label_col})
     if df_ts.empty:
         return _empty_figure("No date data available")
 
-    df_ts["period"] = df_ts["date"].dt.to_period(freq).dt.to_timestamp()
     counts = df_ts.groupby(["period", label_col]).size().reset_index(name="count")
 
     fig = px.area(
@@ -219,20 +255,20 @@ def engagement_by_sentiment(df: pd.DataFrame, label_col: str = "final_label") ->
     if df.empty or "metadata" not in df.columns:
         return _empty_figure("No engagement data available")
 
-    df_eng = df.copy()
-    # Extract engagement from metadata dict
-    def _get_engagement(meta):
-        if not isinstance(meta, dict):
-            return 0
-        return meta.get("score", 0) or meta.get("likes", 0) or meta.get("rating", 0) or 0
-
-    df_eng["engagement"] = df_eng["metadata"].apply(_get_engagement)
+    # One pass over the metadata dicts; per platform, engagement is the first
+    # non-zero of score (Reddit), likes (X.com) or rating (Amazon, e.g. "4.0")
+    engagement = np.fromiter(
+        (_engagement(m) if isinstance(m, dict) else 0.0 for m in df["metadata"]),
+        dtype=float, count=len(df),
+    )
 
-    if df_eng["engagement"].sum() == 0:
+    if engagement.sum() == 0:
         return _empty_figure("No engagement data available")
 
-    agg = df_eng.groupby(label_col)["engagement"].mean().reset_index()
-    agg.columns = ["sentiment", "avg_engagement"]
+    agg = (
+        pd.DataFrame({"sentiment": df[label_col].to_numpy(), "avg_engagement": engagement})
+        .groupby("sentiment")["avg_engagement"].mean().reset_index()
+    )
 
     fig = px.bar(
         agg, x="sentiment", y="avg_engagement", color="sentiment",
@@ -245,15 +281,37 @@ def engagement_by_sentiment(df: pd.DataFrame, label_col: str = "final_label") ->
 
 def top_texts_table(df: pd.DataFrame, sentiment: str = "positive",
                      label_col: str = "final_label", n: int = 10) -> pd.DataFrame:
-    """Return top N texts of a given sentiment."""
+    """Return the top N texts of a given sentiment, strongest VADER score first."""
     if df.empty:
         return pd.DataFrame()
-    filtered = df[df[label_col] == sentiment].copy()
-    cols = ["text", "platform", "date", label_col]
-    if "vader_compound" in filtered.columns:
-        cols.append("vader_compound")
-    available = [c for c in cols if c in filtered.columns]
-    return filtered[available].head(n)
+    cols = ["text", "platform", "date", label_col, "vader_compound"]
+    available = [c for c in cols if c in df.columns]
+
+    idx = np.flatnonzero((df[label_col] == sentiment).to_numpy())
+    if "vader_compound" in df.columns:
+        # Most negative first for negative texts, highest first otherwise
+        scores = df["vader_compound"].to_numpy()[idx]
+        if sentiment != "negative":
+            scores = -scores
+        if len(idx) > n:
+            # Linear-time selection of the top n; only those get sorted
+            keep = np.argpartition(scores, n)[:n]
+            idx, scores = idx[keep], scores[keep]
+        idx = idx[np.argsort(scores, kind="stable")]
+    return df.iloc[idx[:n]][available]
+
+
+def _engagement(meta: dict) -> float:
+    return _num(meta.get("score")) or _num(meta.get("likes")) or _num(meta.get("rating"))
+
+
+def _num(value) -> float:
+    """Metadata value as a float; missing or non-numeric values count as 0."""
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        return 0.0
+    return 0.0 if value != value else value  # NaN
 
 
 def _empty_figure(message: str = "No data") -> go.Figure:
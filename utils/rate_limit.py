@@ -0,0 +1,152 @@
+import asyncio
+import functools
+import logging
+import random
+import time
+
+logger = logging.getLogger(__name__)
+
+# Statuses worth retrying: throttling and transient upstream failures
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class RetryableResponse(Exception):
+    """Raised inside a `retry_async` function to request another attempt."""
+
+    def __init__(self, status: int, retry_after: float = None):
+        super().__init__(f"HTTP {status}")
+        self.status = status
+        self.retry_after = retry_after
+
+
+def retry_after_seconds(headers) -> float:
+    """Parse a Retry-After header given in seconds, or None."""
+    try:
+        return max(0.0, float(headers.get("Retry-After")))
+    except (TypeError, ValueError):
+        return None
+
+
+def retry_async(max_retries: int = 4, max_delay: float = 60.0):
+    """Retry a coroutine on `RetryableResponse` with exponential backoff.
+
+    Waits Retry-After when the server sent one, else 2**attempt seconds plus
+    jitter, capped at max_delay. The last failure is re-raised.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            for attempt in range(max_retries + 1):
+                try:
+                    return await fn(*args, **kwargs)
+                except RetryableResponse as e:
+                    if attempt == max_retries:
+                        raise
+                    delay = e.retry_after if e.retry_after is not None else 2 ** attempt + random.random()
+                    delay = min(max_delay, delay)
+                    logger.warning(f"{fn.__qualname__}: {e}, retrying in {delay:.1f}s...")
+                    await asyncio.sleep(delay)
+        return wrapper
+    return decorator
+
+
+class HostRateLimiter:
+    """Per-host token bucket driven by the server's rate-limit headers.
+
+    After each response `update` records the remaining request budget and the
+    reset time (Reddit `x-ratelimit-*`, X.com `x-rate-limit-*`). `wait` takes
+    one request from that budget, sleeping until the reset once it drops to
+    `threshold`; hosts that send no headers are spaced `fallback_interval`
+    seconds apart instead. Concurrent callers for a host queue on a lock, so
+    each sees the budget left by the one before it.
+    """
+
+    REMAINING_HEADERS = ("x-ratelimit-remaining", "x-rate-limit-remaining")
+    RESET_HEADERS = ("x-ratelimit-reset", "x-rate-limit-reset")
+    # Reset times drift slightly between responses; a jump beyond this is a new window
+    WINDOW_SLACK = 1.0
+
+    def __init__(self, threshold: int = 2, fallback_interval: float = 0.0, max_wait: float = 60.0):
+        self.threshold = threshold
+        self.fallback_interval = fallback_interval
+        self.max_wait = max_wait
+        self._hosts = {}
+        self._locks = {}
+        self._loop = None
+
+    async def wait(self, host: str) -> bool:
+        """Sleep until a request to host is allowed, then claim it.
+
+        Returns False without sleeping if that would take longer than max_wait.
+        """
+        async with self._lock(host):
+            state = self._hosts.get(host)
+            if state is None:
+                # No response yet; later callers are spaced from this request
+                now = time.monotonic()
+                self._hosts[host] = {"remaining": None, "reset_at": now, "last": now}
+                return True
+
+            while True:
+                delay = self._delay(state, time.monotonic())
+                if delay <= 0:
+                    break
+                if delay > self.max_wait:
+                    return False
+                await asyncio.sleep(delay)
+                state = self._hosts[host]  # responses may have updated it meanwhile
+
+            if state["remaining"] is not None:
+                if state["remaining"] <= self.threshold:
+                    state["remaining"] = None  # window has reset; next response reports the new budget
+                else:
+                    state["remaining"] -= 1
+            state["last"] = time.monotonic()
+            return True
+
+    def _delay(self, state: dict, now: float) -> float:
+        if state["remaining"] is not None:
+            return state["reset_at"] - now if state["remaining"] <= self.threshold else 0.0
+        return state["last"] + self.fallback_interval - now
+
+    def _lock(self, host: str) -> asyncio.Lock:
+        # Collectors run each collect() in a fresh asyncio.run loop, and a
+        # lock can't be shared across loops
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._locks = {}
+        return self._locks.setdefault(host, asyncio.Lock())
+
+    def update(self, host: str, headers):
+        """Record a response's rate-limit headers.
+
+        The host's state is updated in place, so a `wait` sleeping on it sees
+        the change; `last` is only ever moved by claims.
+        """
+        now = time.monotonic()
+        state = self._hosts.setdefault(host, {"remaining": None, "reset_at": now, "last": now})
+        remaining = _first_float(headers, self.REMAINING_HEADERS)
+        if remaining is None:
+            return
+        reset = _first_float(headers, self.RESET_HEADERS)
+        if reset is not None and reset > 1e9:
+            reset -= time.time()  # X.com sends an epoch timestamp, Reddit sends seconds left
+        reset_at = now + max(0.0, reset or 0.0)
+
+        if state["remaining"] is None or reset_at > state["reset_at"] + self.WINDOW_SLACK:
+            # First report, or a new window
+            state["remaining"] = remaining
+        else:
+            # Late response in the same window: don't hand back budget already claimed
+            state["remaining"] = min(state["remaining"], remaining)
+        state["reset_at"] = reset_at
+
+
+def _first_float(headers, names) -> float:
+    for name in names:
+        try:
+            return float(headers.get(name))
+        except (TypeError, ValueError):
+            continue
+    return None
@@ -1,21 +1,17 @@
-import matplotlib
-matplotlib.use("Agg")
+import io
 
-import matplotlib.pyplot as plt
 from wordcloud import WordCloud
 import streamlit as st
 
 
-def generate_wordcloud(texts: list, title: str = "Word Cloud",
-                        max_words: int = 100, colormap: str = "viridis") -> plt.Figure:
-    """Generate and return a matplotlib figure with a word cloud."""
+# Reruns triggered by widgets in other tabs reuse the rendered PNGs
+@st.cache_data(show_spinner=False, max_entries=32)
+def generate_wordcloud(texts: list, max_words: int = 100, colormap: str = "viridis") -> bytes:
+    """Render a word cloud straight to PNG bytes, or None if there is no text."""
     combined_text = " ".join(str(t) for t in texts if isinstance(t, str))
 
     if not combined_text.strip():
-        fig, ax = plt.subplots(figsize=(8, 4))
-        ax.text(0.5, 0.5, "No text data available", ha="center", va="center", fontsize=14)
-        ax.axis("off")
-        return fig
+        return None
 
     wc = WordCloud(
         width=800,
@@ -26,12 +22,9 @@ def generate_wordcloud(texts: list, title: str = "Word Cloud",
         collocations=False,
     ).generate(combined_text)
 
-    fig, ax = plt.subplots(figsize=(10, 5))
-    ax.imshow(wc, interpolation="bilinear")
-    ax.axis("off")
-    ax.set_title(title, fontsize=14, fontweight="bold")
-    plt.tight_layout()
-    return fig
+    buf = io.BytesIO()
+    wc.to_image().save(buf, format="PNG")
+    return buf.getvalue()
 
 
 def display_sentiment_wordclouds(df, label_col="final_label"):
@@ -47,6 +40,8 @@ def display_sentiment_wordclouds(df, label_col="final_label"):
             texts = df[df[label_col] == sentiment]["clean_text"].dropna().tolist()
             if not texts and "text" in df.columns:
                 texts = df[df[label_col] == sentiment]["text"].dropna().tolist()
-            fig = generate_wordcloud(texts, title, colormap=cmap)
-            st.pyplot(fig)
-            plt.close(fig)
+            png = generate_wordcloud(texts, colormap=cmap)
+            if png is None:
+                st.info(f"{title}: no text data available")
+            else:
+                st.image(png, caption=title, use_container_width=True)